@@ -1,19 +1,93 @@
 """Minimal script to open the control-unit serial port and read raw bytes."""
 
 import argparse
+import os
+import select
 import sys
 import time
-from typing import Iterable
+from typing import Callable, Iterable
 
 import serial
 
 from pdu_reader import DEFAULT_BAUDRATE, DEFAULT_PORT, DEFAULT_TIMEOUT, list_serial_ports
 
+# Rendered lines are written to stdout in batches once either limit is reached.
+FLUSH_MAX_LINES = 64
+FLUSH_INTERVAL = 0.1
+
 
 def render_bytes(data: Iterable[int]) -> str:
     """Render a short chunk of bytes as a space-separated hex string."""
 
-    return " ".join(f"{b:02X}" for b in data)
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    return data.hex(" ").upper()
+
+
+def make_chunk_reader(
+    ser: serial.Serial,
+    chunk_size: int,
+    stop_at: float | None = None,
+) -> Callable[[float | None], bytes]:
+    """Return a callable that reads the next chunk of bytes from an open port.
+
+    On POSIX the port's file descriptor is read directly with ``os.read`` behind a
+    ``select`` timeout guard; pyserial is only used to open and configure the port.
+    The wait is also capped at the time left until ``stop_at`` (a
+    ``time.monotonic`` value), so a timed capture ends on schedule.
+    Elsewhere, a blocking single-byte read is followed by a drain of whatever the
+    driver has queued. Either way an empty result means the timeout expired.
+
+    The returned callable accepts an optional ``max_wait`` in seconds that further
+    bounds how long it waits for data, so callers holding unwritten output can
+    return to it in time.
+    """
+
+    timeout = ser.timeout
+
+    if os.name == "posix":
+        fd = ser.fileno()
+
+        def read_chunk(max_wait: float | None = None) -> bytes:
+            wait = timeout
+            if stop_at is not None:
+                remaining = max(0.0, stop_at - time.monotonic())
+                wait = remaining if wait is None else min(wait, remaining)
+            if max_wait is not None:
+                wait = max_wait if wait is None else min(wait, max_wait)
+            ready, _, _ = select.select([fd], [], [], wait)
+            if not ready:
+                return b""
+            try:
+                chunk = os.read(fd, chunk_size)
+            except BlockingIOError:
+                return b""
+            if not chunk:
+                raise serial.SerialException(
+                    "device reports readiness to read but returned no data "
+                    "(device disconnected or multiple access on port?)"
+                )
+            return chunk
+
+        return read_chunk
+
+    def read_chunk(max_wait: float | None = None) -> bytes:
+        if max_wait is not None and not ser.in_waiting:
+            # Changing ser.timeout reconfigures the port, so wait out the
+            # shorter budget here instead of inside a blocking read.
+            time.sleep(max_wait)
+            if not ser.in_waiting:
+                return b""
+        # Block on a single byte (bounded by the configured timeout), then
+        # drain whatever else the driver has queued in one call.
+        chunk = ser.read(1)
+        if chunk:
+            pending = ser.in_waiting
+            if pending:
+                chunk += ser.read(min(pending, chunk_size - 1))
+        return chunk
+
+    return read_chunk
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -44,11 +118,21 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--chunk-size",
         type=int,
-        default=128,
-        help="Maximum number of bytes to read per serial read call",
+        default=4096,
+        help="Maximum number of already-buffered bytes to drain per serial read call",
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help=(
+            "Write the received bytes to stdout unchanged instead of rendering them as hex "
+            "(useful when redirecting a capture to a file)"
+        ),
     )
 
     args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
     if args.port is None:
         ports = list_serial_ports()
         if ports:
@@ -83,16 +167,55 @@ def read_forever(args: argparse.Namespace) -> None:
         else:
             stop_at = None
 
+        # In raw mode chunks go to the binary stdout buffer untouched; otherwise
+        # each chunk becomes one line of hex.
+        if args.raw:
+            stream, render, sep, end = sys.stdout.buffer, bytes, b"", b""
+        else:
+            stream, render, sep, end = sys.stdout, render_bytes, "\n", "\n"
+
+        # A terminal gets each batch right away; when redirected, stdout stays
+        # block-buffered and is only flushed on exit.
+        interactive = stream.isatty()
+
+        read_chunk = make_chunk_reader(ser, args.chunk_size, stop_at)
+        out_buf: list = []
+        last_flush = time.monotonic()
+
+        def flush() -> None:
+            nonlocal last_flush
+            if out_buf:
+                stream.write(sep.join(out_buf) + end)
+                if interactive:
+                    stream.flush()
+                out_buf.clear()
+            last_flush = time.monotonic()
+
+        # Bind hot-loop lookups to locals.
+        monotonic = time.monotonic
+        append = out_buf.append
+        max_lines = FLUSH_MAX_LINES
+        interval = FLUSH_INTERVAL
+
         try:
             while True:
-                if stop_at is not None and time.monotonic() >= stop_at:
+                if stop_at is not None and monotonic() >= stop_at:
                     break
 
-                chunk = ser.read(args.chunk_size)
+                # With output pending, wake up in time to flush it on schedule.
+                max_wait = None
+                if out_buf:
+                    max_wait = max(0.0, last_flush + interval - monotonic())
+                chunk = read_chunk(max_wait)
                 if chunk:
-                    print(render_bytes(chunk))
+                    append(render(chunk))
+                if len(out_buf) >= max_lines or monotonic() - last_flush > interval:
+                    flush()
         except KeyboardInterrupt:
             pass
+        finally:
+            flush()
+            stream.flush()
 
 
 if __name__ == "__main__":
@@ -24,8 +24,11 @@ Example:
 from __future__ import annotations
 
 import argparse
+import queue
+import re
+import threading
 import time
-from typing import List, Sequence
+from typing import Callable, List, Sequence
 
 import serial
 import sys
@@ -39,40 +42,108 @@ from pdu_reader import (
     _read_one_frame_from_serial,
 )
 
+# Upper bound on how many queued lines the stdout writer emits per write call.
+FLUSH_MAX_LINES = 64
+
+# Lines that may wait for the stdout writer before the serial reader blocks.
+WRITER_QUEUE_SIZE = 1024
+
+# Polling interval while waiting for the first response byte after a write.
+REPLY_POLL_INTERVAL = 0.002
+
+# Separators accepted between bytes in a --request string.
+_HEX_SEPARATORS = re.compile(r"[\s,;]+")
+
+# A single request byte: one or two hex digits with an optional 0x/0X prefix.
+_HEX_BYTE = re.compile(r"(?:0[xX])?([0-9A-Fa-f]{1,2})")
+
 
 def _format_bytes(data: bytes) -> str:
     """Render bytes as "AA, BB, CC" (uppercase hex with leading zeroes)."""
 
-    return ", ".join(f"{b:02X}" for b in data)
+    return data.hex(" ").upper().replace(" ", ", ")
+
+
+def _write_lines(lines: List[str], flush: bool = True) -> None:
+    """Write buffered lines to stdout in one call and empty the buffer."""
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        if flush:
+            sys.stdout.flush()
+        lines.clear()
+
+
+def _stdout_writer(lines: "queue.Queue[str | None]", errors: List[BaseException]) -> None:
+    """Drain queued lines to stdout until a ``None`` sentinel arrives.
+
+    Runs on a worker thread so that slow terminals or pipes never stall the
+    serial reader. Whatever has queued up since the last write is emitted in a
+    single batch. Batches are flushed immediately only when stdout is a
+    terminal; redirected output stays block-buffered until the sentinel.
+
+    A failed write (e.g. a closed pipe or a full disk) is appended to ``errors``
+    for the main thread to re-raise; later lines are discarded so producers
+    never block on a queue nobody drains.
+    """
+
+    interactive = sys.stdout.isatty()
+    batch: List[str] = []
+    while True:
+        line = lines.get()
+        while line is not None:
+            batch.append(line)
+            if len(batch) >= FLUSH_MAX_LINES:
+                break
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                break
+        if not errors:
+            try:
+                _write_lines(batch, flush=interactive)
+                if line is None:
+                    sys.stdout.flush()
+            except Exception as exc:
+                errors.append(exc)
+        batch.clear()
+        if line is None:
+            return
 
 
 def _parse_hex_sequence(text: str) -> bytes:
     """Convert a string like "7E 14,17 00" or "0x7E,0x14,0x17,0x00" to bytes.
 
-    Whitespace, commas, and semicolons are treated as separators. Prefixes such
-    as ``0x`` or ``0X`` are allowed. Raises ``ValueError`` if any token fails to
-    parse as a base-0 integer or is out of byte range.
+    Whitespace, commas, and semicolons are treated as separators. Every token is
+    read as hexadecimal, so ``10`` means 0x10; each token must be one or two hex
+    digits with an optional ``0x``/``0X`` prefix. Raises ``ValueError`` for any
+    other token, including ones with a ``0b`` or ``0o`` prefix, rather than
+    guessing which byte was meant.
     """
 
     if not text:
         raise ValueError("Empty request cannot be converted to bytes")
 
-    tokens: List[str] = []
-    for part in text.replace(",", " ").replace(";", " ").split():
-        if part:
-            tokens.append(part)
+    tokens = [part for part in _HEX_SEPARATORS.split(text.strip()) if part]
     if not tokens:
         raise ValueError("No hex tokens found in request string")
 
+    # Fast path: clean two-digit tokens go straight through bytes.fromhex.
+    digits = [token[2:] if token[:2] in ("0x", "0X") else token for token in tokens]
+    if all(len(d) == 2 for d in digits):
+        try:
+            return bytes.fromhex("".join(digits))
+        except ValueError:
+            pass  # fall through for a per-token error message
+
     values: List[int] = []
     for token in tokens:
-        try:
-            value = int(token, 0)
-        except ValueError as exc:  # pragma: no cover - explicit message preferred
-            raise ValueError(f"Could not parse '{token}' as a hex byte") from exc
-        if not 0 <= value <= 0xFF:
-            raise ValueError(f"Value {value} from '{token}' is outside byte range")
-        values.append(value)
+        if len(token) > 2 and token[:2].lower() in ("0b", "0o"):
+            raise ValueError(f"Unsupported prefix in '{token}'; only 0x is accepted")
+        match = _HEX_BYTE.fullmatch(token)
+        if match is None:
+            raise ValueError(f"Could not parse '{token}' as a one- or two-digit hex byte")
+        values.append(int(match.group(1), 16))
 
     return bytes(values)
 
@@ -83,40 +154,47 @@ def _read_frames(
     count: int,
     *,
     label: str,
+    emit: Callable[[str], None],
     after_write_delay: float | None = None,
 ) -> None:
-    """Read ``count`` frames from an open serial link and print them."""
+    """Read ``count`` frames from an open serial link and emit them."""
 
     if after_write_delay:
-        time.sleep(after_write_delay)
+        # Wait at most ``after_write_delay``, but start reading as soon as the
+        # reply begins to arrive.
+        deadline = time.monotonic() + after_write_delay
+        while ser.in_waiting == 0 and time.monotonic() < deadline:
+            time.sleep(REPLY_POLL_INTERVAL)
 
     for idx in range(1, count + 1):
         frame_with_flags, _ = _read_one_frame_from_serial(ser, cfg)
-        print(f"{label} {idx}: {_format_bytes(frame_with_flags)}")
+        emit(f"{label} {idx}: {_format_bytes(frame_with_flags)}")
 
 
 def _listen_for_initial_values(
     ser: serial.Serial,
     cfg: ReadConfig,
     initial_seconds: float,
+    emit: Callable[[str], None],
 ) -> None:
     """Collect automatically streamed frames for a time budget."""
 
-    deadline = time.time() + initial_seconds
+    now = time.monotonic()
+    deadline = now + initial_seconds
     observed = 0
-    while time.time() < deadline:
+    while now < deadline:
         try:
             frame_with_flags, _ = _read_one_frame_from_serial(ser, cfg)
         except TimeoutError:
             # If nothing arrives within the timeout, keep looping until deadline
-            if time.time() >= deadline:
-                break
+            now = time.monotonic()
             continue
         observed += 1
-        print(f"Okamzite frame {observed}: {_format_bytes(frame_with_flags)}")
+        emit(f"Okamzite frame {observed}: {_format_bytes(frame_with_flags)}")
+        now = time.monotonic()
 
     if observed == 0:
-        print("No Okamzite hodnoty frames captured within the initial window.")
+        emit("No Okamzite hodnoty frames captured within the initial window.")
 
 
 def _send_requests_and_collect(
@@ -125,18 +203,22 @@ def _send_requests_and_collect(
     requests: Sequence[bytes],
     responses_per_request: int,
     post_write_delay: float,
+    emit: Callable[[str], None],
+    flush_after_write: bool = False,
 ) -> None:
     """Transmit each request and gather the specified number of replies."""
 
     for req_idx, request in enumerate(requests, start=1):
         ser.write(request)
-        ser.flush()
-        print(f"Sent request {req_idx}: {_format_bytes(request)}")
+        if flush_after_write:
+            ser.flush()
+        emit(f"Sent request {req_idx}: {_format_bytes(request)}")
         _read_frames(
             ser,
             cfg,
             responses_per_request,
             label=f"Response to request {req_idx}",
+            emit=emit,
             after_write_delay=post_write_delay,
         )
 
@@ -174,6 +256,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=[],
         help=(
             "Hex bytes to transmit for a query (e.g., '7E 14 17 00'). "
+            "Every token is read as hex, so '10' sends 0x10; an optional 0x prefix is allowed. "
             "Repeat the flag to send multiple requests."
         ),
     )
@@ -187,7 +270,19 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         "--post-write-delay",
         type=float,
         default=0.2,
-        help="Seconds to wait after writing before reading responses",
+        help=(
+            "Upper bound in seconds on the wait for the first reply byte after a write; "
+            "reading starts as soon as any byte arrives, so this is not a minimum delay."
+        ),
+    )
+    parser.add_argument(
+        "--flush-after-write",
+        action="store_true",
+        help=(
+            "Block until each request has left the UART before waiting for responses. "
+            "Use this on half-duplex links that need the transmission to finish before "
+            "the reply is read."
+        ),
     )
 
     args = parser.parse_args(argv)
@@ -225,24 +320,46 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
     )
 
-    with serial.Serial(
-        port=args.port,
-        baudrate=cfg.baudrate,
-        timeout=cfg.timeout,
-        inter_byte_timeout=cfg.interbyte_timeout,
-    ) as ser:
-        _listen_for_initial_values(ser, cfg, args.initial_seconds)
-
-        if requests:
-            _send_requests_and_collect(
-                ser,
-                cfg,
-                requests,
-                responses_per_request=args.responses_per_request,
-                post_write_delay=args.post_write_delay,
-            )
-        else:
-            print("No additional requests provided; exiting after initial capture.")
+    # Output is handed to a writer thread so stdout never blocks serial reads;
+    # a single FIFO queue keeps lines in capture order.
+    lines: "queue.Queue[str | None]" = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+    write_errors: List[BaseException] = []
+    writer = threading.Thread(target=_stdout_writer, args=(lines, write_errors), daemon=True)
+    writer.start()
+
+    def emit(line: str) -> None:
+        # Stop the capture as soon as stdout has failed.
+        if write_errors:
+            raise write_errors[0]
+        lines.put(line)
+
+    try:
+        with serial.Serial(
+            port=args.port,
+            baudrate=cfg.baudrate,
+            timeout=cfg.timeout,
+            inter_byte_timeout=cfg.interbyte_timeout,
+        ) as ser:
+            _listen_for_initial_values(ser, cfg, args.initial_seconds, emit)
+
+            if requests:
+                _send_requests_and_collect(
+                    ser,
+                    cfg,
+                    requests,
+                    responses_per_request=args.responses_per_request,
+                    post_write_delay=args.post_write_delay,
+                    emit=emit,
+                    flush_after_write=args.flush_after_write,
+                )
+            else:
+                emit("No additional requests provided; exiting after initial capture.")
+    finally:
+        lines.put(None)
+        writer.join()
+
+    if write_errors:
+        raise write_errors[0]
 
     return 0
 